@@ -0,0 +1,21 @@
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; saves there stay last-writer-wins
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: Path):
+    """
+    Hold an exclusive lock on `<path>.lock` so parallel sessions can
+    read-merge-replace a shared file without losing each other's entries.
+    """
+    lock_path = path.with_name(f"{path.name}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield  # Closing the file releases the lock
@@ -1,16 +1,37 @@
 import logging
 import re
-from typing import Dict, List, Set
-from spellchecker import SpellChecker
+from typing import Dict, FrozenSet, List
 
 logger = logging.getLogger(__name__)
 
+# Capital letter sequences or title-case words (like "Gob")
+_LETTER_SEQ_RE = re.compile(r'\b[A-Z]{2,10}\b|\b[A-Z][a-z]{1,9}\b')
+_SUGGESTION_RE = re.compile(r'\b[A-Za-z]{4,15}\b')
+
 class LetterCluesManager:
     """Manages letter clues for level 6+ passwords."""
     
-    def __init__(self):
+    def __init__(self, spell=None):
         self.level_clues = {}  # level -> {'responses': [], 'candidates': set()}
-        self.spell = SpellChecker()
+        # Pass a loaded SpellChecker to share its dictionary; otherwise one is
+        # created on first use - parsing the dictionary is slow and only level 6+ needs it
+        self._spell = spell
+        self._word_set = None
+    
+    def _load_word_set(self):
+        """Build the word set from the SpellChecker dictionary, creating one if none was given."""
+        if self._spell is None:
+            from spellchecker import SpellChecker
+            self._spell = SpellChecker()
+        # Plain set membership is much cheaper than spell.known() in the combination loops
+        self._word_set = frozenset(self._spell.word_frequency.dictionary.keys())
+    
+    @property
+    def word_set(self) -> FrozenSet[str]:
+        """All dictionary words, lowercase."""
+        if self._word_set is None:
+            self._load_word_set()
+        return self._word_set
     
     def add_clue(self, level: int, question: str, response: str):
         """Store a clue response for analysis."""
@@ -32,35 +53,36 @@ class LetterCluesManager:
         if len(clues) < 2:  # Need at least 2 clues to work with
             return []
         
-        # Extract letter fragments from all responses
-        fragments = []
+        # Extract letter fragments from all responses, keeping the first
+        # occurrence of each letter sequence (same clue answered twice)
+        fragment_map = {}
         for clue in clues:
             response = clue['response']
-            question = clue['question']
+            question_type = self._classify_question(clue['question'])
             
             # Extract any capital letter sequences or mixed case words (like "Gob")
             # Include both all-caps and title-case words
-            letter_sequences = re.findall(r'\b[A-Z]{2,10}\b|\b[A-Z][a-z]{1,9}\b', response)
+            letter_sequences = _LETTER_SEQ_RE.findall(response)
             for seq in letter_sequences:
-                fragments.append({
-                    'letters': seq.upper(),
-                    'question_type': self._classify_question(question),
+                letters = seq.upper()
+                fragment_map.setdefault(letters, {
+                    'letters': letters,
+                    'question_type': question_type,
                     'full_response': response
                 })
+        fragments = list(fragment_map.values())
         
         if not fragments:
             return []
         
-        # Deduplicate overlapping fragments
-        unique_fragments = []
-        for frag in fragments:
-            is_substring = False
-            for other in fragments:
-                if frag['letters'] != other['letters'] and frag['letters'] in other['letters']:
-                    is_substring = True
-                    break
-            if not is_substring:
-                unique_fragments.append(frag)
+        # Deduplicate overlapping fragments: walk letter strings longest first
+        # so each one is only checked against already-accepted strings
+        accepted = []
+        for letters in sorted(fragment_map, key=len, reverse=True):
+            if not any(letters in other for other in accepted):
+                accepted.append(letters)
+        accepted_set = set(accepted)
+        unique_fragments = [frag for frag in fragments if frag['letters'] in accepted_set]
         fragments = unique_fragments if unique_fragments else fragments
         
         # First, try simple direct combinations
@@ -79,11 +101,12 @@ class LetterCluesManager:
             candidates = self._parse_llm_suggestions(result)
             
             # Validate candidates are real words
-            valid_candidates = []
-            for word in candidates:
-                if self.spell.known([word.lower()]) or len(word) >= 10:
-                    valid_candidates.append(word.upper())
-                    logger.info(f"Valid candidate from clues: {word.upper()}")
+            valid_candidates = [
+                word.upper() for word in candidates
+                if len(word) >= 10 or word.lower() in self.word_set
+            ]
+            if valid_candidates:
+                logger.info(f"Valid candidates from clues: {valid_candidates}")
             
             return valid_candidates[:3]  # Return top 3
             
@@ -95,24 +118,26 @@ class LetterCluesManager:
     
     def _try_direct_combinations(self, fragments: List[Dict]) -> List[str]:
         """Try directly combining first and last fragments."""
-        first_frags = [f['letters'] for f in fragments if f['question_type'] == 'first']
-        last_frags = [f['letters'] for f in fragments if f['question_type'] == 'last']
+        by_type = {'first': [], 'last': []}
+        for f in fragments:
+            if f['question_type'] in by_type:
+                by_type[f['question_type']].append(f['letters'])
         
         candidates = []
         
-        # Try all combinations of first + last
-        for first in first_frags:
-            for last in last_frags:
+        # Try all combinations of first + last (fragments are unique by letters)
+        for first in by_type['first']:
+            for last in by_type['last']:
                 # Direct concatenation
                 word = first + last
-                if self.spell.known([word.lower()]):
+                if word.lower() in self.word_set:
                     candidates.append(word)
                     logger.info(f"Direct combination found: {word}")
                 
                 # Try with one letter overlap (common pattern)
                 if first[-1] == last[0]:
                     word = first + last[1:]
-                    if self.spell.known([word.lower()]):
+                    if word.lower() in self.word_set:
                         candidates.append(word)
                         logger.info(f"Overlap combination found: {word}")
         
@@ -161,7 +186,7 @@ class LetterCluesManager:
         """Parse LLM response for word suggestions."""
         words = []
         # Look for any word-like strings
-        potential_words = re.findall(r'\b[A-Za-z]{4,15}\b', llm_response)
+        potential_words = _SUGGESTION_RE.findall(llm_response)
         
         for word in potential_words:
             word_upper = word.upper()
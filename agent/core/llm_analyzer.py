@@ -1,49 +1,269 @@
 import requests
+from requests.adapters import HTTPAdapter
+import atexit
+import hashlib
 import json
 import re
+import string
+import threading
 import logging
-from typing import List
-import re
+import os
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from spellchecker import SpellChecker
-from agent.core.letter_clues_manager import LetterCluesManager
+from agent.core.file_lock import file_lock
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the extraction hot path
+_CAPS_WORD_RE = re.compile(r'\b[A-Z]{3,15}\b')
+_NON_LETTER_RE = re.compile(r'[^A-Za-z]')
+_SPELLING_AND_RE = re.compile(r'([A-Z](?:\s*,\s*[A-Z])*)\s*,?\s*and\s+([A-Z])', re.IGNORECASE)
+_SPELLING_PATTERNS = [
+    re.compile(r'(?:^|[^A-Za-z])([A-Z](?:\s*[-,\.]\s*[A-Z]){2,})(?:[^A-Za-z]|$)', re.IGNORECASE),
+    re.compile(r'(?:^|\s)([A-Z](?:\s+[A-Z]){2,})(?:\s|$)', re.IGNORECASE),
+]
+_DOTS_RE = re.compile(r'([A-Z])\.{2,}', re.IGNORECASE)
+_SINGLE_LETTER_RE = re.compile(r'\b[A-Z]\b', re.IGNORECASE)
+_LINE_FIRST_LETTER_RE = re.compile(r'^[^\S\n]*([A-Za-z])', re.MULTILINE)
+_COMMA_FIRST_LETTER_RE = re.compile(r'(?:^|,)[^A-Za-z,]*([A-Za-z])')
+_COMBINED_WORD_RE = re.compile(r'(?:combined|full)\s+word\s+is[:\s]+([A-Za-z]{3,20})', re.IGNORECASE)
+_LETTERS_PREFIX_RE = re.compile(r'(letters?|spells?)\s*[^A-Za-z]*([A-Za-z,\s\-–—]+)', re.IGNORECASE)
+_SPACED_LETTERS_RE = re.compile(r'\b(?:[A-Za-z]\s*(?:-|–|—|,|\s)){2,}[A-Za-z]\b')
+_QUOTED_RE = re.compile(r'"([A-Za-z]{3,20})"')
+_PHRASE_RE = re.compile(r'\b(?:password|secret|code|word)\b.*?\bis\b[:\s"]*([A-Za-z]{3,20})', re.IGNORECASE)
+_PHRASE_KEYWORDS = ('password', 'secret', 'code', 'word')
+# "direct"/"reverse" string values of a JSON reply, even one cut off mid-value
+_JSON_FIELD_RE = re.compile(r'"(direct|reverse)"\s*:\s*"([^"]*)')
+_TOKEN_RE = re.compile(r'\b[A-Za-z]{3,20}\b')
+_STOPWORDS = frozenset({
+    "THE","AND","CAN","CODE","WORD","WORDS","PASSWORD","SECRET","HIDDEN",
+    "PLEASE","CANNOT","INCANTATION","WILL","MUST","ACCESS","KEY"
+})
+# Deletes everything but ASCII letters from the separator runs _clean_result matches
+_NON_LETTER_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(0x3001))
+    if (ord(ch) < 256 and not ('A' <= ch <= 'Z' or 'a' <= ch <= 'z')) or ch.isspace()
+) + '–—')
+
+# Marks A-Z so a run of capitals becomes a plain substring test
+_CAPS_MARK_TABLE = str.maketrans({c: '\x01' for c in string.ascii_uppercase})
+
+
+def _has_caps_run(s: str, k: int = 3) -> bool:
+    """Cheap check for k consecutive capitals before running a caps-word regex."""
+    return '\x01' * k in s.translate(_CAPS_MARK_TABLE)
+
+
+# Bump when prompts or extractors change so stale on-disk extractions are ignored
+_EXTRACTION_CACHE_VERSION = "2"
+
+
+def _extraction_cache_key(*fields: str) -> str:
+    """sha256 over length-prefixed fields, so different field splits never collide."""
+    digest = hashlib.sha256()
+    for field in fields:
+        data = field.encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'big'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+# One keep-alive connection pool shared by all Ollama calls
+_session = requests.Session()
+_session.headers['Content-Type'] = 'application/json'
+_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+# Ollama replies by (model, base_url, prompt, num_predict, json_format).
+# Temperature 0.0 makes replies deterministic, so they are kept across runs.
+_REPLY_CACHE_PATH = Path("~/.hackmerlin_cache/ollama_replies.json").expanduser()
+_reply_cache: Dict[Tuple[str, str, str, int, bool], str] = {}
+_reply_cache_loaded = False
+_reply_cache_dirty = False
+
+
+def _load_reply_cache():
+    """Read replies saved by earlier runs."""
+    global _reply_cache_loaded
+    _reply_cache_loaded = True
+    if not _REPLY_CACHE_PATH.exists():
+        return
+    try:
+        with open(_REPLY_CACHE_PATH) as f:
+            for model_name, base_url, prompt, num_predict, json_format, reply in json.load(f):
+                _reply_cache.setdefault((model_name, base_url, prompt, num_predict, json_format), reply)
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable Ollama reply cache: {e}")
+
+
+@atexit.register
+def save_reply_cache():
+    """
+    Write replies back to disk if this run added any. Runs at exit, and must
+    also be called directly from pool workers, which exit without atexit hooks.
+    Replies other processes saved meanwhile are merged in under a file lock,
+    and the file is swapped in atomically.
+    """
+    global _reply_cache_dirty
+    if not _reply_cache_dirty:
+        return
+    try:
+        with file_lock(_REPLY_CACHE_PATH):
+            _load_reply_cache()
+            tmp_path = _REPLY_CACHE_PATH.with_name(f"{_REPLY_CACHE_PATH.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump([[*key, reply] for key, reply in _reply_cache.items()], f)
+            os.replace(tmp_path, _REPLY_CACHE_PATH)
+        _reply_cache_dirty = False
+    except OSError as e:
+        logger.warning(f"Could not save Ollama reply cache: {e}")
+
+
+def _cached_ollama_request(model_name: str, base_url: str, prompt: str,
+                           num_predict: int = 10, json_format: bool = False) -> str:
+    """Return a remembered reply for this exact request, calling Ollama on a miss."""
+    global _reply_cache_dirty
+    if not _reply_cache_loaded:
+        _load_reply_cache()
+    
+    key = (model_name, base_url, prompt, num_predict, json_format)
+    if key not in _reply_cache:
+        _reply_cache[key] = _ollama_request(*key)
+        _reply_cache_dirty = True
+    return _reply_cache[key]
+
+
+def _ollama_request(model_name: str, base_url: str, prompt: str,
+                    num_predict: int = 10, json_format: bool = False) -> str:
+    """
+    Call Ollama with minimal settings.
+    The reply is read whole; num_predict already keeps it short.
+    """
+    payload = {
+        "model": model_name,
+        "prompt": prompt,
+        "stream": False,
+        "options": {
+            "temperature": 0.0,
+            "num_predict": num_predict,  # Default is very short - just the word
+        }
+    }
+    if json_format:
+        payload["format"] = "json"
+    
+    response = _session.post(f"{base_url}/api/generate", json=payload, timeout=30)
+    if response.status_code == 200:
+        return response.json()['response']
+    else:
+        raise Exception(f"Ollama API failed: {response.status_code}")
+
+
 class LLMAnalyzer:
     """Ultra-simplified pattern recognition with very direct prompts."""
     
-    def __init__(self, model_name: str = "llama3.2:3b"):
+    _SPELL: Optional[SpellChecker] = None  # Shared across instances, loading the dictionary is slow
+    _DELETE_INDEX: Optional[Dict[str, List[str]]] = None  # deletion variant -> words
+    _DELETE_INDEX_BUILD: Optional[threading.Thread] = None
+    _DELETE_INDEX_LOCK = threading.Lock()
+    
+    def __init__(self, model_name: str = "llama3.2:3b", cache_dir: Optional[str] = None):
         self.model_name = model_name
         self.base_url = "http://localhost:11434"
+        self.cache_dir = Path(cache_dir or "~/.hackmerlin_cache/extractions").expanduser()
+        self.start_delete_index_build()  # Takes seconds, so build it while the browser starts
+        self._extraction_cache: Dict[Tuple[str, str], List[str]] = {}  # (strategy, response) -> passwords
+        self._last_response_cache: Dict[str, Any] = {}  # {'response': str, 'candidates': {strategy: word}}
+        
+        # (strategy, level >= 6) -> extractor(response, level, question)
+        self._dispatch: Dict[Tuple[str, bool], Callable[[str, int, str], List[str]]] = {}
+        for name, extractor in (("direct", self._extract_direct),
+                                ("spelling", self._extract_spelling),
+                                ("reverse", self._extract_reverse),
+                                ("acronym", self._extract_acronym)):
+            for late_level in (False, True):
+                self._dispatch[(name, late_level)] = partial(self._extract_cached, name, extractor)
+        self._dispatch[("letters", False)] = self._extract_letters_level6
+        self._dispatch[("letters", True)] = self._extract_letters_level6
+        self._dispatch[("acronym", True)] = self._extract_acronym_with_clue
+        self._generic_extractor = partial(self._extract_cached, "generic", self._extract_direct)
     
     def extract_passwords(self, response: str, strategy_used: str, question_asked: str, level: int = 0) -> List[str]:
         """Extract using strategy-specific ultra-simple prompts."""
-        if level >= 6 and strategy_used == "letters":
-            return self._extract_letters_level6(response, level, question_asked)
-        
-        if level >= 6 and strategy_used == "acronym":
-            result = self._extract_acronym(response)
-            if result and hasattr(self, 'letter_clues_manager'):
-                self.letter_clues_manager.add_clue(level, question_asked, f"WORD: {result[0]}")
-            return result
-        
-        if strategy_used == "direct":
-            return self._extract_direct(response)
-        elif strategy_used == "spelling":
-            return self._extract_spelling(response)
-        elif strategy_used == "reverse":
-            return self._extract_reverse(response)
-        elif strategy_used == "letters":
-            return self._extract_letters_level6(response)
-        elif strategy_used == "acronym":
-            return self._extract_acronym(response)
-        else:
-            return self._extract_generic(response)
+        handler = self._dispatch.get((strategy_used, level >= 6), self._generic_extractor)
+        return handler(response, level, question_asked)
+    
+    def _extract_cached(self, strategy_used: str, extractor: Callable[[str], List[str]],
+                        response: str, level: int, question: str) -> List[str]:
+        """
+        Run an extractor that depends only on the response, reusing results on
+        retries and, through cache_dir, across sessions.
+        """
+        cache_key = (strategy_used, response)
+        if cache_key in self._extraction_cache:
+            return list(self._extraction_cache[cache_key])
+        
+        passwords = self._load_extraction(strategy_used, response)
+        if passwords is None:
+            passwords = extractor(response)
+            if passwords:
+                self._store_extraction(strategy_used, response, passwords)
+        if passwords:
+            self._extraction_cache[cache_key] = list(passwords)
+        return passwords
+    
+    def _extraction_path(self, strategy_used: str, response: str) -> Path:
+        key = _extraction_cache_key(self.model_name, _EXTRACTION_CACHE_VERSION, strategy_used, response)
+        return self.cache_dir / f"{key}.json"
+    
+    def _load_extraction(self, strategy_used: str, response: str) -> Optional[List[str]]:
+        """Return passwords saved by an earlier session, or None on a miss."""
+        path = self._extraction_path(strategy_used, response)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                passwords = json.load(f)['passwords']
+            if isinstance(passwords, list) and all(isinstance(p, str) for p in passwords):
+                return passwords
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        logger.warning(f"Dropping malformed extraction cache entry {path.name}")
+        path.unlink(missing_ok=True)
+        return None
+    
+    def _store_extraction(self, strategy_used: str, response: str, passwords: List[str]):
+        """Save extracted passwords for later sessions."""
+        path = self._extraction_path(strategy_used, response)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so parallel sessions never read a half-written entry
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'passwords': passwords,
+                    'model': self.model_name,
+                    'strategy': strategy_used,
+                    'created_utc': datetime.now(timezone.utc).isoformat()
+                }, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save extraction cache entry: {e}")
+    
+    def _extract_acronym_with_clue(self, response: str, level: int, question: str) -> List[str]:
+        """Level 6+ acronym: also store the decoded word as a clue."""
+        result = self._extract_acronym(response)
+        if result and hasattr(self, 'letter_clues_manager'):
+            self.letter_clues_manager.add_clue(level, question, f"WORD: {result[0]}")
+        return result
     
     def _extract_direct(self, response: str) -> List[str]:
         """Extract direct password mention."""
         # Find all words that are all caps and 3+ letters
-        caps_words = re.findall(r'\b[A-Z]{3,15}\b', response)
+        # (skip the regex when the reply has no run of capitals at all)
+        caps_words = _CAPS_WORD_RE.findall(response) if _has_caps_run(response) else []
         
         # If exactly one all-caps word, return it
         if len(caps_words) == 1:
@@ -51,52 +271,38 @@ class LLMAnalyzer:
             return [caps_words[0]]
         
         # Otherwise, proceed with LLM
-        prompt = f'Text: "{response}"\nFind the password word. Just the word:'
-        
-        try:
-            result = self._call_ollama(prompt)
-            word = self._clean_result(result)
-            if word:
-                logger.info(f"Direct extracted: {word}")
-                return [word]
-        except Exception as e:
-            logger.error(f"Direct extraction failed: {e}")
+        word = self.extract_all(response).get('direct', '')
+        if word:
+            logger.info(f"Direct extracted: {word}")
+            return [word]
         return []
     
     def _extract_spelling(self, response: str) -> List[str]:
         """Extract spelled out letters - fix spelling by looking for same or longer words."""        
-        and_pattern = re.search(r'([A-Z](?:\s*,\s*[A-Z])*)\s*,?\s*and\s+([A-Z])', response, re.IGNORECASE)
+        and_pattern = _SPELLING_AND_RE.search(response)
 
         if and_pattern:
             # Get all letters before 'and' plus the letter after 'and'
-            letters_before = re.findall(r'[A-Za-z]', and_pattern.group(1))
-            letter_after = and_pattern.group(2)
-            letters = letters_before + [letter_after]
+            letters = ''.join(filter(str.isalpha, and_pattern.group(1))) + and_pattern.group(2)
             if len(letters) >= 3:
-                word = ''.join(letters).upper()
+                word = letters.upper()
                 fixed_word = self._try_fix_spelling_common(word)
                 logger.info(f"Spelling extracted (with 'and'): {fixed_word}")
                 return [fixed_word]
     
         
         # Pattern 1: Letters with separators
-        patterns = [
-            r'(?:^|[^A-Za-z])([A-Z](?:\s*[-,\.]\s*[A-Z]){2,})(?:[^A-Za-z]|$)',
-            r'(?:^|\s)([A-Z](?:\s+[A-Z]){2,})(?:\s|$)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, response, re.IGNORECASE)
+        for pattern in _SPELLING_PATTERNS:
+            matches = pattern.findall(response)
             for match in matches:
-                letters = re.findall(r'[A-Za-z]', match)
-                if len(letters) >= 3:
-                    word = ''.join(letters)
+                word = ''.join(filter(str.isalpha, match))
+                if len(word) >= 3:
                     fixed_word = self._try_fix_spelling_common(word)
                     logger.info(f"Spelling extracted: {fixed_word}")
                     return [fixed_word]
         
         # Pattern 2: Dots
-        dots_letters = re.findall(r'([A-Z])\.{2,}', response, re.IGNORECASE)
+        dots_letters = _DOTS_RE.findall(response)
         if len(dots_letters) >= 3:
             word = ''.join(dots_letters)
             fixed_word = self._try_fix_spelling_common(word)
@@ -104,7 +310,7 @@ class LLMAnalyzer:
             return [fixed_word]
         
         # Pattern 3: Isolated single letters
-        single_letters = re.findall(r'\b[A-Z]\b', response, re.IGNORECASE)
+        single_letters = _SINGLE_LETTER_RE.findall(response)
         if 3 <= len(single_letters) <= 10:
             word = ''.join(single_letters)
             fixed_word = self._try_fix_spelling_common(word)
@@ -117,7 +323,7 @@ class LLMAnalyzer:
         """Extract and reverse backwards word."""
         
         # Method 1: Look for exactly one all-caps word (3-15 letters)
-        caps_words = re.findall(r'\b[A-Z]{3,15}\b', response)
+        caps_words = _CAPS_WORD_RE.findall(response) if _has_caps_run(response) else []
         if len(caps_words) == 1:
             reversed_word = caps_words[0][::-1]
             fixed_word = self._try_fix_spelling_common(reversed_word)
@@ -125,27 +331,67 @@ class LLMAnalyzer:
             return [fixed_word]
         
         # Method 2: If response is just one word (no spaces), reverse it
-        stripped = re.sub(r'[^A-Za-z]', '', response.strip())
+        stripped = _NON_LETTER_RE.sub('', response.strip())
         if stripped and 3 <= len(stripped) <= 15:
             reversed_word = stripped[::-1].upper()
             fixed_word = self._try_fix_spelling_common(reversed_word)
             logger.info(f"Reverse extracted (stripped): {fixed_word}")
             return [fixed_word]
         
-        # Method 3: LLM fallback only if no clear single word found
-        prompt = f'Text: "{response}"\nFind the backwards word and spell it forwards. Just the word:'
+        # Method 3: Several all-caps words - the longest is most likely the backwards word
+        if caps_words:
+            reversed_word = max(caps_words, key=len)[::-1]
+            fixed_word = self._try_fix_spelling_common(reversed_word)
+            logger.info(f"Reverse extracted (longest caps): {fixed_word}")
+            return [fixed_word]
+        
+        # Method 4: LLM fallback only if no clear single word found
+        word = self.extract_all(response).get('reverse', '')
+        if word and 3 <= len(word) <= 15:
+            fixed_word = self._try_fix_spelling_common(word)
+            logger.info(f"Reverse extracted (LLM): {fixed_word}")
+            return [fixed_word]
         
+        return []
+    
+    def extract_all(self, response: str) -> Dict[str, str]:
+        """
+        Ask the LLM for the direct and reverse readings of a response in one
+        call, the two strategies that fall back to it. The result is kept for
+        the last response, so both fallbacks on the same reply cost one round trip.
+        """
+        if self._last_response_cache.get('response') == response:
+            return self._last_response_cache['candidates']
+        
+        prompt = (
+            f'Text: "{response}"\n'
+            'Return JSON with one word per key: '
+            '{"direct": the password word, '
+            '"reverse": the backwards word spelled forwards}'
+        )
+        
+        candidates = {}
         try:
-            result = self._call_ollama(prompt)
-            word = self._clean_result(result)
-            if word and 3 <= len(word) <= 15:
-                fixed_word = self._try_fix_spelling_common(word)
-                logger.info(f"Reverse extracted (LLM): {fixed_word}")
-                return [fixed_word]
+            # Roomy budget: pretty-printed JSON and long words take many tokens
+            result = self._call_ollama(prompt, num_predict=60, json_format=True)
         except Exception as e:
-            logger.error(f"Reverse extraction failed: {e}")
+            logger.error(f"Combined extraction failed: {e}")
+            return candidates
         
-        return []
+        try:
+            data = json.loads(result)
+        except ValueError:
+            # Cut off before the JSON closed - salvage whatever values were written
+            logger.warning("Combined extraction reply is not valid JSON, reading it as text")
+            data = dict(_JSON_FIELD_RE.findall(result)) or {'direct': result}
+        if isinstance(data, dict):
+            for key in ('direct', 'reverse'):
+                word = self._clean_result(str(data.get(key) or ''))
+                if word:
+                    candidates[key] = word
+        
+        self._last_response_cache = {'response': response, 'candidates': candidates}
+        return candidates
     
     def _clean_result(self, text: str) -> str:
         """Extract a clean candidate from an LLM reply without latching onto THE/KEY/etc."""
@@ -153,72 +399,63 @@ class LLMAnalyzer:
         if not text:
             return ""
 
-        STOPWORDS = {
-            "THE","AND","CAN","CODE","WORD","WORDS","PASSWORD","SECRET","HIDDEN",
-            "PLEASE","CANNOT","INCANTATION","WILL","MUST","ACCESS","KEY"
-        }
-
         t = text.strip()
+        # Literal keyword checks let most replies skip the keyword patterns entirely
+        lower_t = t.lower()
 
         # 1) If the model already summarized it, prefer that.
-        m = re.search(r'(?:combined|full)\s+word\s+is[:\s]+([A-Za-z]{3,20})', t, flags=re.I)
+        m = _COMBINED_WORD_RE.search(t) if 'word' in lower_t else None
         if m:
             return m.group(1).upper()
 
         # 2) Join spelled-out letters like "T - H - U - N - D - E - R" or "J, I, G, S, A, W"
         #    Prefer when the reply mentions "letters"/"spell(s)" but also catch generic patterns.
         # 2a) After "letters"/"spells"
-        m = re.search(r'(letters?|spells?)\s*[^A-Za-z]*([A-Za-z,\s\-–—]+)', t, flags=re.I)
+        m = _LETTERS_PREFIX_RE.search(t) if 'letter' in lower_t or 'spell' in lower_t else None
         if m:
-            letters = re.findall(r'[A-Za-z]', m.group(2))
+            letters = m.group(2).translate(_NON_LETTER_TABLE)
             if len(letters) >= 3:
-                return ''.join(letters).upper()
+                return letters.upper()
 
         # 2b) Generic hyphen/comma/space-separated single letters anywhere
-        m = re.search(r'\b(?:[A-Za-z]\s*(?:-|–|—|,|\s)){2,}[A-Za-z]\b', t)
+        m = _SPACED_LETTERS_RE.search(t)
         if m:
-            letters = re.findall(r'[A-Za-z]', m.group(0))
+            letters = m.group(0).translate(_NON_LETTER_TABLE)
             if len(letters) >= 3:
-                return ''.join(letters).upper()
+                return letters.upper()
 
         # 3) Quoted word:  The word you seek is "REVERIE".
-        q = re.findall(r'"([A-Za-z]{3,20})"', t)
+        q = _QUOTED_RE.findall(t)
         if q:
             return q[-1].upper()
 
         # 4) Phrase templates: "the password/word is X"
-        m = re.search(r'\b(?:password|secret|code|word)\b.*?\bis\b[:\s"]*([A-Za-z]{3,20})', t, flags=re.I)
+        m = _PHRASE_RE.search(t) if any(k in lower_t for k in _PHRASE_KEYWORDS) else None
         if m:
             return m.group(1).upper()
 
         # 5) Last resort: first reasonable token, skipping obvious junk
-        for w in re.findall(r'\b[A-Za-z]{3,20}\b', t):
-            W = w.upper()
-            if W not in STOPWORDS:
+        for m in _TOKEN_RE.finditer(t):
+            W = m.group().upper()
+            if W not in _STOPWORDS:
                 return W
 
         return ""
     
     def _extract_acronym(self, response: str) -> List[str]:
         """Extract first letters from lines."""
-        lines = response.strip().split(',')  # Split by commas first
-        if len(lines) == 1:
-            # Find words starting with capital letters
-            capital_words = re.findall(r'\b[A-Z][a-z]*\b', response)
-            first_letters = [word[0] for word in capital_words]
-        
-        first_letters = []
-        for line in lines:
-            line = line.strip()
-            if line:
-                # Get first alphabetic character
-                for char in line:
-                    if char.isalpha():
-                        first_letters.append(char.upper())
-                        break
+        # Poems put each letter on its own line
+        word = ''.join(_LINE_FIRST_LETTER_RE.findall(response)).upper()
+        if 3 <= len(word) <= 15:
+            fixed_word = self._try_fix_spelling_common(word)
+            logger.info(f"Acronym extracted (lines): {fixed_word}")
+            return [fixed_word]
+        
+        # Otherwise take the first letter of each comma-separated part
+        first_letters = _COMMA_FIRST_LETTER_RE.findall(response)
         
         if len(first_letters) >= 3:
-            word = ''.join(first_letters)
+            word = ''.join(first_letters).upper()
             # Apply spellcheck for common mistakes like GLITER->GLITTER
             fixed_word = self._try_fix_spelling_common(word)
             logger.info(f"Acronym extracted: {fixed_word}")
@@ -226,85 +463,96 @@ class LLMAnalyzer:
         
         return []
     
-    def _call_ollama(self, prompt: str) -> str:
+    @classmethod
+    def get_spell(cls) -> SpellChecker:
+        """Return the shared SpellChecker, creating it on first use."""
+        if cls._SPELL is None:
+            cls._SPELL = SpellChecker()
+        return cls._SPELL
+    
+    @classmethod
+    def start_delete_index_build(cls):
+        """Start building the shared deletion index in a background thread, once per process."""
+        with cls._DELETE_INDEX_LOCK:
+            if cls._DELETE_INDEX_BUILD is None:
+                cls._DELETE_INDEX_BUILD = threading.Thread(
+                    target=cls._build_delete_index, name="delete-index", daemon=True
+                )
+                cls._DELETE_INDEX_BUILD.start()
+    
+    @classmethod
+    def get_delete_index(cls) -> Dict[str, List[str]]:
+        """Return the deletion index, waiting for the background build if needed."""
+        if cls._DELETE_INDEX is None:
+            cls.start_delete_index_build()
+            cls._DELETE_INDEX_BUILD.join()
+        if cls._DELETE_INDEX is None:
+            # The background build failed; retry here so its error reaches the caller
+            cls._build_delete_index()
+        return cls._DELETE_INDEX
+    
+    @classmethod
+    def _build_delete_index(cls):
         """
-        Call Ollama with minimal settings.
+        Map every single-letter deletion of each dictionary word (up to 10 letters)
+        to the words producing it, so one-edit neighbours are hash lookups.
+        Covers every known word, as the old alphabet scan did: about 650k keys.
         """
-        payload = {
-            "model": self.model_name,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.0,
-                "num_predict": 10,  # Very short - just the word
-            }
-        }
-        
-        response = requests.post(f"{self.base_url}/api/generate", json=payload, timeout=30)
-        if response.status_code == 200:
-            return response.json()['response']
-        else:
-            raise Exception(f"Ollama API failed: {response.status_code}")
+        index = {}
+        for dict_word in cls.get_spell().word_frequency.dictionary:
+            if len(dict_word) <= 10 and dict_word.isascii() and dict_word.isalpha():
+                for deleted in {dict_word[:i] + dict_word[i+1:] for i in range(len(dict_word))}:
+                    index.setdefault(deleted, []).append(dict_word)
+        cls._DELETE_INDEX = index
+    
+    def _call_ollama(self, prompt: str, num_predict: int = 10, json_format: bool = False) -> str:
+        """Call Ollama, reusing cached replies for repeated prompts."""
+        return _cached_ollama_request(self.model_name, self.base_url, prompt, num_predict, json_format)
 
     def _try_fix_spelling_common(self, word: str) -> str:
-        """Try to fix word by finding valid COMMON words of same length or longer."""
-        from spellchecker import SpellChecker
-        spell = SpellChecker()
+        """Try to fix word by finding known words of same length or one letter longer."""
+        spell = self.get_spell()
         
         word_lower = word.lower()
         
-        # If already valid AND common, return as-is
+        # If already a known word, return as-is
         if spell.known([word_lower]):
-            # Check if it's a common word (high frequency)
-            word_freq = spell.word_frequency[word_lower]
-            if word_freq > 1e-6:  # Threshold for common words
-                return word.upper()
+            return word.upper()
         
         # Only try to fix words under 10 letters
         if len(word) >= 10:
             return word.upper()
         
-        # Try adding each letter of the alphabet to see if it makes a valid word
-        alphabet = 'abcdefghijklmnopqrstuvwxyz'
-        candidates = []
+        index = self.get_delete_index()
         
-        # Try inserting a letter at each position
-        for pos in range(len(word_lower) + 1):
-            for letter in alphabet:
-                candidate = word_lower[:pos] + letter + word_lower[pos:]
-                if spell.known([candidate]):
-                    # Check frequency
-                    if spell.word_frequency[candidate] > 1e-6:
-                        candidates.append(candidate)
+        # Known words one letter longer that lose a letter to become this word
+        candidates = list(index.get(word_lower, []))
         
-        # Try replacing each letter
+        # Known words of the same length that differ in exactly one letter
         for pos in range(len(word_lower)):
-            for letter in alphabet:
-                if letter != word_lower[pos]:
-                    candidate = word_lower[:pos] + letter + word_lower[pos+1:]
-                    if spell.known([candidate]) and len(candidate) >= len(word_lower):
-                        # Check frequency
-                        if spell.word_frequency[candidate] > 1e-6:
-                            candidates.append(candidate)
-        
-        # If we found valid COMMON candidates, prefer those that are longer
+            for candidate in index.get(word_lower[:pos] + word_lower[pos+1:], []):
+                if (len(candidate) == len(word_lower) and
+                        sum(a != b for a, b in zip(candidate, word_lower)) == 1):
+                    candidates.append(candidate)
+        
+        # If we found known candidates, prefer the most frequent, then the longest
         if candidates:
-            # Sort by frequency (more common first), then by length
-            candidates.sort(key=lambda x: (spell.word_frequency[x], len(x)), reverse=True)
-            result = candidates[0].upper()
+            best = max(candidates, key=lambda c: (spell.word_frequency[c], len(c)))
+            result = best.upper()
             if result != word.upper():
                 logger.info(f"Spelling corrected: {word.upper()} -> {result}")
             return result
         
-        # No common word found, return original
+        # No known word found, return original
         return word.upper()
     
     def _extract_letters_level6(self, response: str, level: int, question: str) -> List[str]:
         """Special extraction for level 6+ that uses context accumulation."""
         
-        # Initialize manager if not exists
+        # Initialize manager if not exists (imported here since only level 6+ needs it)
         if not hasattr(self, 'letter_clues_manager'):
-            self.letter_clues_manager = LetterCluesManager()
+            from agent.core.letter_clues_manager import LetterCluesManager
+            self.letter_clues_manager = LetterCluesManager(spell=self.get_spell())
         
         # Store this clue
         self.letter_clues_manager.add_clue(level, question, response)
@@ -1,23 +1,49 @@
 import logging
-import time
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Optional
 from agent.web_interface.merlin_interface import MerlinInterface
 from agent.strategies.strategy_manager import StrategyManager
 from agent.core.llm_analyzer import LLMAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# A lone all-caps word this shape is trusted without asking the LLM
+_CONFIDENT_PASSWORD_RE = re.compile(r'[A-Z]{4,12}')
+
 class HackMerlinAgent:
     """Main agent that orchestrates everything."""
     
-    def __init__(self, headless: bool = True, use_llm_extraction: bool = True):
+    _DEFLECTION_PHRASES = (
+        "i cannot",
+        "cannot reveal",
+        "cannot provide", 
+        "cannot assist",
+        "cannot comply",
+        "cannot tell",
+        "must remain hidden",
+        "shall remain hidden",
+        "forbidden to",
+        "not allowed to",
+        "unable to",
+        "will not",
+        "refuse to",
+        "not be spoken",
+        "known only to those",
+        "not be revealed",
+        "fulfill that request"
+    )
+    # All phrases in one case-insensitive pattern: a single scan, no lowercased copy
+    _DEFLECTION_RE = re.compile("|".join(map(re.escape, _DEFLECTION_PHRASES)), re.IGNORECASE)
+    
+    def __init__(self, headless: bool = True, use_llm_extraction: bool = True, cache_dir: Optional[str] = None):
         self.interface = MerlinInterface(headless=headless)
         self.strategy_manager = StrategyManager()
-        self.llm_analyzer = LLMAnalyzer() if use_llm_extraction else None
+        self.llm_analyzer = LLMAnalyzer(cache_dir=cache_dir) if use_llm_extraction else None
         
         self.session_results = {
             'levels_completed': 0,
-            'level_details': {}
+            'level_details': {},
+            'extraction_paths': {'regex': 0, 'llm': 0}  # which path found each correct password
         }
     
     def play_game(self, max_levels: int = 7) -> Dict[str, Any]:
@@ -35,7 +61,6 @@ class HackMerlinAgent:
                     current_level = self.interface.get_current_level()
                     self.session_results['levels_completed'] += 1
                     logger.info(f"Advanced to level {current_level}")
-                    time.sleep(2)
                 else:
                     logger.info(f"Failed at level {current_level}")
                     break
@@ -73,6 +98,15 @@ class HackMerlinAgent:
                 attempts += 1
                 continue
             
+            # Cheap regex pass first - a single clean caps word needs no LLM call
+            regex_password = self._confident_regex_password(response, strategy_name)
+            if regex_password:
+                logger.info(f"Trying (regex): {regex_password}")
+                if self.interface.submit_password(regex_password):
+                    self.session_results['extraction_paths']['regex'] += 1
+                    self.strategy_manager.record_success(level, strategy_name, question)
+                    return True
+            
             # Extract passwords (only if not deflected)
             if self.llm_analyzer:
                 passwords = self.llm_analyzer.extract_passwords(
@@ -84,12 +118,19 @@ class HackMerlinAgent:
             else:
                 passwords = []
             
+            # Don't resubmit the regex candidate that already failed
+            passwords = [p for p in passwords if p != regex_password]
+            
             if passwords:
                 logger.info(f"Trying: {passwords[0]}")
+            elif regex_password:
+                self.strategy_manager.record_failure(level, question)
             
             # Try passwords
             for password in passwords[:1]:
-                if self.interface.submit_password(password):                    
+                if self.interface.submit_password(password):
+                    self.session_results['extraction_paths']['llm'] += 1
+                    self.strategy_manager.record_success(level, strategy_name, question)
                     return True
                 else:
                     # Password failed, record this question as failed
@@ -99,30 +140,18 @@ class HackMerlinAgent:
         
         return False
     
+    def _confident_regex_password(self, response: str, strategy_name: str) -> Optional[str]:
+        """Return the response's only candidate if it is clearly the password."""
+        if strategy_name not in ('direct', 'spelling'):
+            return None
+        candidates = self.interface.extract_passwords_basic(response)
+        if len(candidates) == 1 and _CONFIDENT_PASSWORD_RE.fullmatch(candidates[0]):
+            return candidates[0]
+        return None
+    
     def is_deflection(self, response: str) -> bool:
         """Detect if Merlin is deflecting/refusing to answer."""
-        deflection_phrases = [
-            "i cannot",
-            "cannot reveal",
-            "cannot provide", 
-            "cannot assist",
-            "cannot comply",
-            "cannot tell",
-            "must remain hidden",
-            "shall remain hidden",
-            "forbidden to",
-            "not allowed to",
-            "unable to",
-            "will not",
-            "refuse to",
-            "not be spoken",
-            "known only to those",
-            "not be revealed",
-            "fulfill that request"
-        ]
-        
-        response_lower = response.lower()
-        return any(phrase in response_lower for phrase in deflection_phrases)
+        return self._DEFLECTION_RE.search(response) is not None
     
     def print_summary(self):
         """Print session summary."""
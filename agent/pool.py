@@ -0,0 +1,40 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional
+from agent.hackmerlin_agent import HackMerlinAgent
+from agent.core.llm_analyzer import save_reply_cache
+
+logger = logging.getLogger(__name__)
+
+def _run_session(max_levels: int, cache_dir: Optional[str]) -> Dict[str, Any]:
+    """Play one game in a worker process with its own headless Chrome."""
+    agent = HackMerlinAgent(headless=True, cache_dir=cache_dir)
+    try:
+        return agent.play_game(max_levels=max_levels)
+    finally:
+        # Pool workers exit via os._exit, so the atexit save never runs here
+        save_reply_cache()
+
+def run_sessions(num_sessions: int, max_workers: int = 4, max_levels: int = 7,
+                 cache_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Play independent games in parallel, one browser per worker process.
+    
+    Workers share the on-disk LLM caches, so a response extracted in one
+    session is free in the others.
+    
+    Each worker also holds its own SpellChecker and spelling-fix deletion
+    index, built in the background when its LLMAnalyzer is created: about
+    140 MB of memory per worker on top of Chrome, so size max_workers to match.
+    """
+    logger.info(f"Running {num_sessions} sessions on {max_workers} workers")
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_session, max_levels, cache_dir) for _ in range(num_sessions)]
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Session failed: {e}")
+    
+    return results
@@ -1,15 +1,32 @@
+import json
 import logging
-from typing import List, Tuple
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+from agent.core.file_lock import file_lock
 from .hardcoded_strategies import Strategy, get_all_strategies
 
 logger = logging.getLogger(__name__)
 
 class StrategyManager:
-    def __init__(self):
+    def __init__(self, memory_path: Optional[str] = None):
         self.strategies = get_all_strategies()
-        self.level_memory = {}
+        self._by_name = {s.name: s for s in self.strategies}
+        self._memory_path = Path(memory_path or "~/.hackmerlin/level_memory.json").expanduser()
+        self.level_memory = self._load_memory()  # level -> {strategy, question, last_success_utc}
+        self._memory_tried = set()  # levels whose remembered question was already asked
         self.question_failures = {}  # level -> {question: failure_count}
         self.strategy_level_failures = {}  # strategy_name -> set of levels where it completely failed
+        self._failed_count = {}  # (level, strategy_name) -> number of distinct failed questions
+        self._question_to_strategy = {q: s.name for s in self.strategies for q in s.questions}
+        
+        # Every (strategy, question) pair in priority order; each level walks it with
+        # a cursor and a per-question skip flag set when the question fails
+        self._plan = tuple((s, q) for s in self.strategies for q in s.questions)
+        self._q_index = {q: i for i, (_, q) in enumerate(self._plan)}
+        self._plan_skip = {}  # level -> bytearray, 1 = question failed
+        self._cursor = {}  # level -> next plan index to try
     
     def get_next_question(self, level: int) -> Tuple[str, str, 'Strategy']:
         """Get next question in priority order."""
@@ -24,38 +41,26 @@ class StrategyManager:
                     self.strategy_level_failures[strat_name].add(level)
                     logger.info(f"Auto-dropping strategy '{strat_name}' for level {level}")
         
-        failures = self.question_failures[level]
-        
-        failures = self.question_failures[level]
+        # Ask what worked last time first
+        remembered = self._remembered_question(level)
+        if remembered:
+            return remembered
         
-        for strategy in self.strategies:
-            if self.is_strategy_exhausted(strategy.name):
+        # Continue from the cursor, wrapping around to retry questions that never failed
+        skip = self._level_skip(level)
+        cursor = self._cursor.get(level, 0)
+        for offset in range(len(self._plan)):
+            idx = (cursor + offset) % len(self._plan)
+            if skip[idx]:
                 continue
-            
-            # Check if all questions in this strategy have failed for current level
-            all_failed = True
-            for q in strategy.questions:
-                if failures.get(q, 0) < 1:
-                    all_failed = False
-                    break
-            
-            if all_failed:
-                # This strategy is exhausted for this level
-                self.mark_strategy_failed_for_level(strategy.name, level)
+            strategy, question = self._plan[idx]
+            if self.is_strategy_exhausted(strategy.name):
                 continue
-            
-            question = strategy.get_next_question()
-            if question and failures.get(question, 0) < 1:
-                return question, strategy.name, strategy
-            elif not question:
-                # Strategy exhausted, reset it to start over
-                strategy.reset()
-                question = strategy.get_next_question()
-                if question and failures.get(question, 0) < 1:
-                    return question, strategy.name, strategy
+            self._cursor[level] = idx + 1
+            return question, strategy.name, strategy
         
         # Fallback
-        return "What's the p4ssw0rd?", "direct", self.strategies[0]
+        return "What's the p4ssw0rd?", "direct", self._by_name["direct"]
     
     def record_failure(self, level: int, question: str):
         """Record that this specific question failed."""
@@ -65,9 +70,24 @@ class StrategyManager:
         self.question_failures[level][question] = self.question_failures[level].get(question, 0) + 1
         
         failure_count = self.question_failures[level][question]
+        if failure_count == 1 and question in self._question_to_strategy:
+            self._level_skip(level)[self._q_index[question]] = 1
+            
+            strategy_name = self._question_to_strategy[question]
+            key = (level, strategy_name)
+            self._failed_count[key] = self._failed_count.get(key, 0) + 1
+            # Every question of this strategy has failed for this level
+            if self._failed_count[key] >= len(self._by_name[strategy_name].questions):
+                self.mark_strategy_failed_for_level(strategy_name, level)
         if failure_count >= 3:
             logger.info(f"Question '{question[:30]}...' failed {failure_count} times, dropping it")
             
+    def _level_skip(self, level: int) -> bytearray:
+        """Failed-question flags for a level, aligned with the plan."""
+        if level not in self._plan_skip:
+            self._plan_skip[level] = bytearray(len(self._plan))
+        return self._plan_skip[level]
+    
     def is_strategy_exhausted(self, strategy_name: str) -> bool:
         """Check if a strategy has failed on 1+ different levels."""
         if strategy_name in self.strategy_level_failures:
@@ -82,7 +102,56 @@ class StrategyManager:
         if len(self.strategy_level_failures[strategy_name]) >= 1:
             logger.info(f"Strategy '{strategy_name}' failed, permanently dropping it")
     
-    def record_success(self, level: int, strategy_name: str):
-        """Record successful strategy."""
-        self.level_memory[level] = strategy_name
-        logger.info(f"Strategy '{strategy_name}' successful for level {level}")
\ No newline at end of file
+    def record_success(self, level: int, strategy_name: str, question: Optional[str] = None):
+        """Record successful strategy and remember it for later sessions."""
+        self.level_memory[level] = {
+            'strategy': strategy_name,
+            'question': question,
+            'last_success_utc': datetime.now(timezone.utc).isoformat()
+        }
+        logger.info(f"Strategy '{strategy_name}' successful for level {level}")
+        self._save_memory(level)
+    
+    def _remembered_question(self, level: int) -> Optional[Tuple[str, str, 'Strategy']]:
+        """Return the question that last solved this level, once per level."""
+        if level in self._memory_tried or level not in self.level_memory:
+            return None
+        self._memory_tried.add(level)
+        
+        record = self.level_memory[level]
+        strategy = self._by_name.get(record.get('strategy'))
+        question = record.get('question')
+        if not strategy or not question or self.question_failures[level].get(question, 0) >= 1:
+            return None
+        
+        logger.info(f"Reusing remembered question for level {level}")
+        return question, strategy.name, strategy
+    
+    def _load_memory(self) -> dict:
+        """Load successes saved by earlier sessions."""
+        if not self._memory_path.exists():
+            return {}
+        try:
+            with open(self._memory_path) as f:
+                return {int(level): record for level, record in json.load(f).items()
+                        if isinstance(record, dict)}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable level memory: {e}")
+            return {}
+    
+    def _save_memory(self, level: int):
+        """
+        Write this level's record atomically (temp file + rename). Levels other
+        sessions saved since we loaded are merged in under a file lock.
+        """
+        try:
+            with file_lock(self._memory_path):
+                memory = self._load_memory()
+                memory[level] = self.level_memory[level]
+                tmp_path = self._memory_path.with_name(f"{self._memory_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, 'w') as f:
+                    json.dump({str(lvl): record for lvl, record in memory.items()}, f)
+                os.replace(tmp_path, self._memory_path)
+            self.level_memory = memory
+        except OSError as e:
+            logger.warning(f"Could not save level memory: {e}")
\ No newline at end of file
@@ -4,20 +4,75 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 import time
 import re
 import logging
-from typing import List
+import shutil
+import tempfile
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+GREETING = "Hello traveler! Ask me anything..."
+
+# Result dialog shown after a password submit
+_MODAL_SELECTOR = "[role='dialog'], .mantine-Modal-root"
+# Seconds between the two dismissing Enters when no dialog was detected
+_POPUP_MIN_GAP = 1
+
+# One round trip instead of an XPath lookup plus a .text read per element
+_READ_LEVEL_JS = """
+for (const h of document.querySelectorAll('h1')) {
+    const m = h.textContent.match(/Level (\\d+)/);
+    if (m) return +m[1];
+}
+return null;
+"""
+
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_CAPS_WORD_RE = re.compile(r'\b[A-Z]{3,15}\b')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Same innerText read the wait script compares against; Selenium's .text
+# normalizes whitespace differently and would look like a new reply
+_READ_RESPONSE_JS = "return document.querySelector('blockquote p')?.innerText ?? '';"
+
+# Resolves once the blockquote shows a new, non-empty, non-greeting reply that
+# has stopped changing for quietMs, so a reply rendered in steps is read whole.
+# A MutationObserver reacts to the DOM change itself instead of polling for it.
+_WAIT_FOR_RESPONSE_JS = """
+const [oldText, greeting, timeoutMs, quietMs, done] = arguments;
+const read = () => { const p = document.querySelector('blockquote p'); return p ? p.innerText : null; };
+const isNew = t => t !== null && t !== oldText && t.trim() && t !== greeting;
+let quietTimer = null;
+const settle = () => {
+    clearTimeout(quietTimer);
+    if (!isNew(read())) return;
+    quietTimer = setTimeout(() => {
+        const text = read();
+        if (isNew(text)) { observer.disconnect(); done(text); }
+    }, quietMs);
+};
+const observer = new MutationObserver(settle);
+observer.observe(document.body, {subtree: true, childList: true, characterData: true});
+settle();
+setTimeout(() => { observer.disconnect(); clearTimeout(quietTimer); }, timeoutMs);
+"""
+
+# How long a new reply must stay unchanged before it counts as complete
+_RESPONSE_QUIET_MS = 250
+
 class MerlinInterface:
     """Clean web interface for HackMerlin with working logic from the original."""
     
     def __init__(self, headless: bool = True):
         self.headless = headless
+        self.profile_dir = None  # Set by _setup_driver
         self.driver = self._setup_driver()
         self.current_level = 1
+        self._level_fresh = False  # current_level read since the last page action
+        self._first_navigate = True
     
     def _setup_driver(self):
         """Setup Chrome WebDriver."""
@@ -29,8 +84,19 @@ class MerlinInterface:
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
         
-        driver = webdriver.Chrome(options=options)
-        driver.implicitly_wait(5)
+        # Fresh profile per instance, so parallel workers never share browser state
+        self.profile_dir = tempfile.mkdtemp(prefix="merlin-")
+        options.add_argument(f"--user-data-dir={self.profile_dir}")
+        
+        # No implicit wait: it would stall every lookup of an absent element,
+        # the code waits explicitly where an element may not be there yet
+        try:
+            driver = webdriver.Chrome(options=options)
+        except Exception:
+            # Chrome never started, so close() has nothing to clean up after
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+            raise
         return driver
     
     def navigate_to_game(self):
@@ -38,13 +104,15 @@ class MerlinInterface:
         logger.info("Navigating to https://hackmerlin.io")
         self.driver.get("https://hackmerlin.io")
         
-        # Clear any existing state
-        self.driver.delete_all_cookies()
-        self.driver.execute_script("if(window.localStorage) localStorage.clear();")
-        self.driver.execute_script("if(window.sessionStorage) sessionStorage.clear();")
-        
-        # Refresh to start clean
-        self.driver.refresh()
+        # A new profile has no state yet, only later navigations need a clean slate
+        if not self._first_navigate:
+            self.driver.delete_all_cookies()
+            self.driver.execute_script("if(window.localStorage) localStorage.clear();")
+            self.driver.execute_script("if(window.sessionStorage) sessionStorage.clear();")
+            
+            # Refresh to start clean
+            self.driver.refresh()
+        self._first_navigate = False
         
         try:
             # Wait for the textarea with the exact placeholder
@@ -57,8 +125,8 @@ class MerlinInterface:
                 EC.element_to_be_clickable((By.XPATH, "//button//span[text()='Ask']"))
             )
             
-            # Additional wait for React state updates
-            time.sleep(3)
+            # Wait for React to render the level heading
+            WebDriverWait(self.driver, 10).until(lambda d: self._read_level() is not None)
 
             self._update_level()
             
@@ -69,6 +137,7 @@ class MerlinInterface:
     
     def send_message(self, message: str) -> str:
         """Send message using Enter key with proper response detection."""
+        self._level_fresh = False
         try:            
             # Find the textarea with the specific placeholder
             textarea = WebDriverWait(self.driver, 15).until(
@@ -77,15 +146,19 @@ class MerlinInterface:
             
             # Clear any existing text
             textarea.clear()
-            time.sleep(0.5)
             
-            # Type the message
+            # Type the message and wait for React to hold it
             textarea.send_keys(message)
-            time.sleep(0.5)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: textarea.get_attribute("value") == message
+                )
+            except TimeoutException:
+                logger.debug("Textarea value not confirmed, sending anyway")
             
             # Store current response to detect changes
             try:
-                old_response = self.driver.find_element(By.CSS_SELECTOR, "blockquote p").text
+                old_response = self.driver.execute_script(_READ_RESPONSE_JS)
             except:
                 old_response = ""
             
@@ -104,6 +177,7 @@ class MerlinInterface:
     
     def submit_password(self, password: str) -> bool:
         """Submit password using Enter key with proper level detection."""
+        self._level_fresh = False
         try:
             logger.info(f"Submitting password: {password}")
             
@@ -114,9 +188,13 @@ class MerlinInterface:
             
             # Clear and enter password
             password_input.clear()
-            time.sleep(0.5)
             password_input.send_keys(password.upper())
-            time.sleep(0.5)
+            try:
+                WebDriverWait(self.driver, 5).until(
+                    lambda d: password_input.get_attribute("value") == password.upper()
+                )
+            except TimeoutException:
+                logger.debug("Password value not confirmed, submitting anyway")
             
             # Store current level
             old_level = self.current_level
@@ -124,12 +202,26 @@ class MerlinInterface:
             # Submit using Enter key
             password_input.send_keys(Keys.ENTER)
             
-            # Wait for potential level change or popup
-            time.sleep(3)
+            # Wait for potential level change or popup (a wrong password shows neither)
+            try:
+                WebDriverWait(self.driver, 3).until(
+                    lambda d: (d.find_elements(By.CSS_SELECTOR, _MODAL_SELECTOR) or
+                               (self._read_level() or old_level) != old_level)
+                )
+            except TimeoutException:
+                pass
             
             # Handle any popup/modal with Enter (from working version)
             self._handle_popup()
             
+            # The heading can update just after the popup closes
+            try:
+                WebDriverWait(self.driver, 1).until(
+                    lambda d: (self._read_level() or old_level) != old_level
+                )
+            except TimeoutException:
+                pass
+            
             # Update level and check for success
             self._update_level()
             
@@ -138,7 +230,6 @@ class MerlinInterface:
                 logger.info(f"Password correct! Advanced to level {self.current_level}")
                 
                 # Wait for new level interface to be ready
-                time.sleep(2)
                 try:
                     WebDriverWait(self.driver, 10).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, "textarea[placeholder*='talk to merlin']"))
@@ -158,17 +249,17 @@ class MerlinInterface:
     
     def extract_passwords_basic(self, response: str) -> List[str]:
         """Extract passwords using the proven logic from original."""
-        if not response or response.strip() == "Hello traveler! Ask me anything...":
+        if not response or response.strip() == GREETING:
             return []
             
         passwords = []
         
         # Pattern 1: Text in double quotes (most reliable)
-        quoted_matches = re.findall(r'"([^"]+)"', response)
+        quoted_matches = _QUOTED_RE.findall(response)
         passwords.extend(quoted_matches)
         
         # Pattern 2: All caps words (3-15 characters)
-        caps_matches = re.findall(r'\b[A-Z]{3,15}\b', response)
+        caps_matches = _CAPS_WORD_RE.findall(response)
         passwords.extend(caps_matches)
         
         # Clean up and deduplicate
@@ -177,35 +268,30 @@ class MerlinInterface:
         
         for password in passwords:
             # Remove any non-alphanumeric characters
-            clean_password = re.sub(r'[^a-zA-Z0-9]', '', password)
+            clean_password = _NON_ALNUM_RE.sub('', password)
+            if len(clean_password) < 3:
+                continue
             
-            if (clean_password and 
-                len(clean_password) >= 3 and
-                clean_password.lower() not in seen):
-                seen.add(clean_password.lower())
+            key = clean_password.casefold()
+            if key not in seen:
+                seen.add(key)
                 result.append(clean_password)
         
         return result[:3]
     
     def _wait_for_response_change(self, old_response: str, timeout: int = 20) -> str:
-        """Wait for response to change - using the working logic from original."""
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                blockquote_p = self.driver.find_element(By.CSS_SELECTOR, "blockquote p")
-                current_response = blockquote_p.text
-                
-                # Check if response has changed and is not empty
-                if (current_response != old_response and 
-                    current_response.strip() and 
-                    current_response != "Hello traveler! Ask me anything..."):
-                    return current_response
-                    
-            except Exception as e:
-                logger.debug(f"Waiting for response: {e}")
-            
-            time.sleep(0.5)
+        """Wait for response to change, woken by a DOM mutation observer."""
+        try:
+            self.driver.set_script_timeout(timeout + 1)
+            response = self.driver.execute_async_script(
+                _WAIT_FOR_RESPONSE_JS, old_response, GREETING, timeout * 1000, _RESPONSE_QUIET_MS
+            )
+            if response:
+                return response
+        except TimeoutException:
+            logger.debug("Timed out waiting for response change")
+        except Exception as e:
+            logger.debug(f"Waiting for response: {e}")
         
         # Fallback: return whatever we have
         try:
@@ -216,17 +302,15 @@ class MerlinInterface:
     def _update_level(self):
         """Extract current level from page using working logic."""
         try:
-            # Wait a bit for any state updates
-            time.sleep(1)
-            
-            # Look for level in h1 elements
-            level_elements = self.driver.find_elements(By.XPATH, "//h1[contains(text(), 'Level')]")
-            if level_elements:
-                text = level_elements[0].text
-                match = re.search(r'Level (\d+)', text)
-                if match:
-                    self.current_level = int(match.group(1))
-                    return
+            # Look for level in h1 elements, giving the heading a moment to render
+            try:
+                level = WebDriverWait(self.driver, 5).until(lambda d: self._read_level())
+            except TimeoutException:
+                level = None
+            if level:
+                self.current_level = level
+                self._level_fresh = True
+                return
             
             logger.warning("Could not detect current level, defaulting to 1")
             self.current_level = 1
@@ -237,20 +321,29 @@ class MerlinInterface:
     
     def _handle_popup(self):
         """Handle popups/modals by pressing Enter key - from working version."""
-        try:            
-            # Wait a moment for any popup to appear
-            time.sleep(1)
+        try:
+            # Give any popup a moment to appear
+            try:
+                WebDriverWait(self.driver, 1).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _MODAL_SELECTOR))
+                )
+                dialog_seen = True
+            except TimeoutException:
+                dialog_seen = False
             
             # Press Enter key to dismiss any modal/popup
             self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ENTER)
             
-            # Wait for popup to close
-            time.sleep(1)
+            if dialog_seen:
+                self._wait_for_modal_closed()
+            else:
+                # The selector may not match this popup; keep the gap a second one needs
+                time.sleep(_POPUP_MIN_GAP)
             
             # Press Enter again if needed (sometimes takes two)
             self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ENTER)
-            
-            time.sleep(1)  # Wait for interface to be ready
+            if dialog_seen:
+                self._wait_for_modal_closed()
             
             return True
             
@@ -258,15 +351,33 @@ class MerlinInterface:
             logger.error(f"Error handling level transition: {e}")
             return True  # Continue anyway
     
+    def _wait_for_modal_closed(self, timeout: float = 1):
+        """Wait until no dialog is shown; returns at once when there is none."""
+        try:
+            WebDriverWait(self.driver, timeout).until_not(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _MODAL_SELECTOR))
+            )
+        except TimeoutException:
+            logger.debug("Popup still open")
+    
+    def _read_level(self) -> Optional[int]:
+        """Read the level number from the page heading, None if it isn't shown."""
+        return self.driver.execute_script(_READ_LEVEL_JS)
+    
     def get_current_level(self) -> int:
-        """Get current level number."""
-        self._update_level()
+        """Get current level number, re-read only if the page changed since the last read."""
+        if not self._level_fresh:
+            self._update_level()
         return self.current_level
     
     def close(self):
         """Close the browser."""
-        if self.driver:
+        if getattr(self, 'driver', None):
             self.driver.quit()
+            self.driver = None
+        if getattr(self, 'profile_dir', None):
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
     
     def __del__(self):
         self.close()
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The agent package is used from a checkout, not installed
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("spellchecker")
+
+from agent.core.llm_analyzer import LLMAnalyzer
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return LLMAnalyzer()
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("GLITER", "GLITTER"),    # missing letter
+    ("THUNDR", "THUNDER"),
+    ("PASWORD", "PASSWORD"),
+    ("SECRAT", "SECRET"),     # one wrong letter
+    ("glitter", "GLITTER"),   # known word, only upper-cased
+    ("XQZT", "XQZT"),         # no neighbour, left alone
+    ("ABCDEFGHIJ", "ABCDEFGHIJ"),  # 10+ letters are never fixed
+])
+def test_try_fix_spelling_common(analyzer, word, expected):
+    assert analyzer._try_fix_spelling_common(word) == expected
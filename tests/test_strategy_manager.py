@@ -0,0 +1,69 @@
+import pytest
+from agent.strategies import strategy_manager
+from agent.strategies.hardcoded_strategies import DirectStrategy, SpellingStrategy, LetterStrategy
+from agent.strategies.strategy_manager import StrategyManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return StrategyManager(memory_path=str(tmp_path / "level_memory.json"))
+
+
+def test_single_class_keeps_failure_tracking():
+    assert hasattr(strategy_manager.StrategyManager, "is_strategy_exhausted")
+
+
+def test_walks_plan_in_priority_order(manager):
+    asked = [manager.get_next_question(1)[0] for _ in range(3)]
+    assert asked == [*DirectStrategy.QUESTIONS, SpellingStrategy.QUESTIONS[0]]
+
+
+def test_failed_question_is_skipped_on_wraparound(manager):
+    total = len(manager._plan)
+    first, _, _ = manager.get_next_question(1)
+    manager.record_failure(1, first)
+    asked = [manager.get_next_question(1)[0] for _ in range(total)]
+    assert first not in asked
+
+
+def test_strategy_marked_failed_once_all_its_questions_fail(manager):
+    for question in DirectStrategy.QUESTIONS[:-1]:
+        manager.record_failure(1, question)
+    assert not manager.is_strategy_exhausted("direct")
+    
+    manager.record_failure(1, DirectStrategy.QUESTIONS[-1])
+    assert manager.is_strategy_exhausted("direct")
+    
+    _, strategy_name, _ = manager.get_next_question(2)
+    assert strategy_name != "direct"
+
+
+def test_repeated_failure_counts_once_toward_strategy(manager):
+    for _ in range(len(DirectStrategy.QUESTIONS)):
+        manager.record_failure(1, DirectStrategy.QUESTIONS[0])
+    assert not manager.is_strategy_exhausted("direct")
+
+
+def test_late_levels_skip_dropped_strategies(manager):
+    _, strategy_name, _ = manager.get_next_question(6)
+    assert strategy_name == "letters"
+
+
+def test_success_is_remembered_across_managers(tmp_path):
+    path = str(tmp_path / "level_memory.json")
+    question = LetterStrategy.QUESTIONS[2]
+    StrategyManager(memory_path=path).record_success(3, "letters", question)
+    
+    later = StrategyManager(memory_path=path)
+    assert later.get_next_question(3) == (question, "letters", later._by_name["letters"])
+    # Only asked first once; after that the plan takes over
+    assert later.get_next_question(3)[0] == DirectStrategy.QUESTIONS[0]
+
+
+def test_saves_merge_levels_from_other_managers(tmp_path):
+    path = str(tmp_path / "level_memory.json")
+    first, second = StrategyManager(memory_path=path), StrategyManager(memory_path=path)
+    first.record_success(1, "direct", DirectStrategy.QUESTIONS[0])
+    second.record_success(2, "spelling", SpellingStrategy.QUESTIONS[0])
+    
+    assert set(StrategyManager(memory_path=path).level_memory) == {1, 2}